@@ -4,24 +4,154 @@
 """Base configuration for the Application."""
 
 import logging
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, TextIO
+from typing import Any, Callable, Iterator, Optional, TextIO, TypeVar
+from urllib.parse import urlparse
 
 import yaml
-from pydantic import AnyHttpUrl, BaseModel, Field, IPvAnyAddress, MongoDsn, root_validator
+from pydantic import AnyHttpUrl, BaseModel, Field, IPvAnyAddress, root_validator, validator
 
 from github_runner_manager.configuration import github
 from github_runner_manager.openstack_cloud.configuration import OpenStackConfiguration
 
 logger = logging.getLogger(__name__)
 
+_HTTP_URL_SCHEMES = frozenset(("http", "https"))
+_MONGODB_URL_SCHEMES = frozenset(("mongodb",))
+
+
+def _validate_url(url: str, allowed_schemes: frozenset[str]) -> str:
+    """Validate an URL has one of the allowed schemes and a host.
+
+    Args:
+        url: The URL to validate.
+        allowed_schemes: The URL schemes accepted.
+
+    Raises:
+        ValueError: If the URL is not valid.
+
+    Returns:
+        The validated URL.
+    """
+    parsed_url = urlparse(url)
+    if parsed_url.scheme not in allowed_schemes:
+        raise ValueError(f"URL scheme not permitted, expected one of {sorted(allowed_schemes)}")
+    if not parsed_url.hostname:
+        raise ValueError("URL host required")
+    return url
+
+
+def _get_field(data: dict, key: str) -> Any:
+    """Get a required value from configuration values.
+
+    Args:
+        data: The configuration values.
+        key: The name of the field.
+
+    Raises:
+        ValueError: If the field is missing.
+
+    Returns:
+        The value of the field.
+    """
+    try:
+        return data[key]
+    except KeyError as exc:
+        raise ValueError(f"Missing field {exc}") from exc
+
+
+def _get_str(data: dict, key: str) -> str:
+    """Get a string value from configuration values.
+
+    Args:
+        data: The configuration values.
+        key: The name of the field.
+
+    Raises:
+        TypeError: If the value of the field is not a string.
+
+    Returns:
+        The value of the field.
+    """
+    value = _get_field(data, key)
+    if not isinstance(value, str):
+        raise TypeError(f"Field {key} must be a string")
+    return value
+
+
+def _get_str_list(data: dict, key: str) -> list[str]:
+    """Get a list of strings from configuration values.
+
+    Args:
+        data: The configuration values.
+        key: The name of the field.
+
+    Raises:
+        TypeError: If the value of the field is not a list of strings.
+
+    Returns:
+        The value of the field.
+    """
+    value = _get_field(data, key)
+    if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) for item in value):
+        raise TypeError(f"Field {key} must be a list of strings")
+    return list(value)
+
+
+class _PlainConfig(ABC):  # pylint: disable=too-few-public-methods
+    """Base for the configuration holders implemented as plain dataclasses.
+
+    Direct construction does not perform any validation. Data from untrusted sources should go
+    through `from_dict`, which is also used when the holder is a field of a pydantic model.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, data: dict) -> Any:
+        """Initialize the configuration from a dict.
+
+        Args:
+            data: The configuration values.
+        """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], Any]]:
+        """Get the validators for pydantic models with fields of this type.
+
+        Yields:
+            The validator of the configuration.
+        """
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls, value: Any) -> Any:
+        """Validate a value as the configuration.
+
+        Args:
+            value: The configuration or the configuration values as dict.
+
+        Raises:
+            TypeError: If the value is neither the configuration nor a dict.
+
+        Returns:
+            The configuration.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        raise TypeError(f"{cls.__name__} or dict expected")
+
 
 # The github-runner-manager is being refactor from a library to an application.
 # Once the charm no longer rely on the github-runner-manager as a library this will be removed.
 # The github-runner-manager needs a input representing the user for process execution due to as a
 # library the user needs to be a hardcoded value. With the github-runner-manager as application,
 # user would be the current user running the application.
-@dataclass
+@dataclass(slots=True)
 class UserInfo:
     """The user to run the reactive process.
 
@@ -174,14 +304,35 @@ class SSHDebugConnection(BaseModel):
 
     host: IPvAnyAddress
     port: int = Field(0, gt=0, le=65535)
-    rsa_fingerprint: str = Field(pattern="^SHA256:.*")
-    ed25519_fingerprint: str = Field(pattern="^SHA256:.*")
+    rsa_fingerprint: str
+    ed25519_fingerprint: str
     use_runner_http_proxy: bool = False
     local_proxy_host: str = "127.0.0.1"
     local_proxy_port: int = 3129
 
+    @validator("rsa_fingerprint", "ed25519_fingerprint")
+    @classmethod
+    def check_fingerprint_prefix(cls, v: str) -> str:
+        """Check that the fingerprint is a SHA256 fingerprint.
+
+        The prefix is a literal, a prefix comparison is used instead of a regex pattern.
+
+        Args:
+            v: The fingerprint to check.
+
+        Returns:
+            The fingerprint if it is valid.
+
+        Raises:
+            ValueError: If the fingerprint does not start with SHA256:.
+        """
+        if not v.startswith("SHA256:"):
+            raise ValueError("fingerprint must start with SHA256:")
+        return v
+
 
-class RepoPolicyComplianceConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RepoPolicyComplianceConfig(_PlainConfig):
     """Configuration for the repo policy compliance service.
 
     Attributes:
@@ -190,7 +341,22 @@ class RepoPolicyComplianceConfig(BaseModel):
     """
 
     token: str
-    url: AnyHttpUrl
+    url: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RepoPolicyComplianceConfig":
+        """Initialize the configuration from a dict.
+
+        Args:
+            data: The configuration values.
+
+        Returns:
+            The repo policy compliance configuration.
+        """
+        return cls(
+            token=_get_str(data, "token"),
+            url=_validate_url(_get_str(data, "url"), _HTTP_URL_SCHEMES),
+        )
 
 
 class NonReactiveConfiguration(BaseModel):
@@ -235,7 +401,8 @@ class ReactiveConfiguration(BaseModel):
     flavors: "list[Flavor]"
 
 
-class QueueConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class QueueConfig(_PlainConfig):
     """The configuration for the message queue.
 
     Attributes:
@@ -243,33 +410,62 @@ class QueueConfig(BaseModel):
         queue_name: The name of the queue.
     """
 
-    mongodb_uri: MongoDsn
+    mongodb_uri: str
     queue_name: str
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "QueueConfig":
+        """Initialize the configuration from a dict.
 
-class Image(BaseModel):
-    """Information for an image with its associated labels.
+        Args:
+            data: The configuration values.
 
-    Attributes:
-        name: Image name or id.
-        labels: List of labels associated to the image.
-    """
+        Returns:
+            The message queue configuration.
+        """
+        return cls(
+            mongodb_uri=_validate_url(_get_str(data, "mongodb_uri"), _MONGODB_URL_SCHEMES),
+            queue_name=_get_str(data, "queue_name"),
+        )
 
-    name: str
-    labels: list[str]
 
+_LabelledConfigT = TypeVar("_LabelledConfigT", bound="_LabelledConfig")
 
-class Flavor(BaseModel):
-    """Information for a flavor with its associated labels.
+
+@dataclass(slots=True, frozen=True)
+class _LabelledConfig(_PlainConfig):
+    """Base for the information of an OpenStack resource with its associated labels.
 
     Attributes:
-        name: Flavor name of id.
-        labels: List of labels associated to the flavor.
+        name: Resource name or id.
+        labels: List of labels associated to the resource.
     """
 
     name: str
     labels: list[str]
 
+    @classmethod
+    def from_dict(cls: type[_LabelledConfigT], data: dict) -> _LabelledConfigT:
+        """Initialize the resource information from a dict.
+
+        Args:
+            data: The resource information values.
+
+        Returns:
+            The resource information.
+        """
+        return cls(name=_get_str(data, "name"), labels=_get_str_list(data, "labels"))
+
+
+@dataclass(slots=True, frozen=True)
+class Image(_LabelledConfig):
+    """Information for an image with its associated labels."""
+
+
+@dataclass(slots=True, frozen=True)
+class Flavor(_LabelledConfig):
+    """Information for a flavor with its associated labels."""
+
 
 # For pydantic to work with forward references.
 ApplicationConfiguration.update_forward_refs()
@@ -3,7 +3,8 @@
 
 """Module containing the main classes for business logic."""
 
-import secrets
+import functools
+import os
 from dataclasses import asdict, dataclass, field
 
 INSTANCE_SUFFIX_LENGTH = 12
@@ -35,7 +36,8 @@ class InstanceID:
     reactive: bool | None
     suffix: str
 
-    @property
+    # The fields are frozen, so the name is only built once.
+    @functools.cached_property
     def name(self) -> str:
         """Returns the name of the instance.
 
@@ -98,8 +100,8 @@ class InstanceID:
         '<', '>', '\', '|', '*' and '?'.
 
         The collision rate calculation:
-        alphanumeric 12 chars long (26 alphabet + 10 digits = 36)
-        36^12 is big enough for our use-case.
+        hexadecimal 12 chars long (16 digits)
+        16^12 is big enough for our use-case.
 
         Args:
            prefix: Prefix for the InstanceID.
@@ -111,7 +113,7 @@ class InstanceID:
         Raises:
             InstanceIDInvalidError: If the instance name is not valid (too long).
         """
-        suffix = secrets.token_hex(INSTANCE_SUFFIX_LENGTH // 2)
+        suffix = os.urandom(INSTANCE_SUFFIX_LENGTH // 2).hex()
         instance_id = cls(prefix=prefix, reactive=reactive, suffix=suffix)
         # By default, for OpenStack with MySQL, the limit is 64 characters.
         if len(instance_id.name) > 64:
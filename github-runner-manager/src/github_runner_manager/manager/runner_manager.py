@@ -438,11 +438,12 @@ class RunnerManager:
 
         return total_stats
 
-    @dataclass
+    @dataclass(slots=True)
     class _CreateRunnerArgs:
         """Arguments for the _create_runner function.
 
-        These arguments are used in the forked processes and should be reviewed.
+        These arguments are used in the forked processes and should be reviewed. One instance is
+        created per runner to spawn, all of them share the same labels list.
 
         Attrs:
             cloud_runner_manager: For managing the cloud instance of the runner.
@@ -2,27 +2,25 @@
 # See LICENSE file for licensing details.
 
 """Class for accessing OpenStack API for managing servers."""
+
+from __future__ import annotations
+
 import copy
 import functools
 import logging
+import os
 import shutil
+import threading
+import weakref
+from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import reduce
 from pathlib import Path
-from typing import Any, Callable, Iterable, Iterator, ParamSpec, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, ParamSpec, TypeVar, cast
 
-import keystoneauth1.exceptions
-import openstack
-import openstack.exceptions
 import paramiko
 from fabric import Connection as SSHConnection
-from openstack.compute.v2.keypair import Keypair as OpenstackKeypair
-from openstack.compute.v2.server import Server as OpenstackServer
-from openstack.connection import Connection as OpenstackConnection
-from openstack.network.v2.security_group import SecurityGroup as OpenstackSecurityGroup
-from openstack.network.v2.security_group_rule import SecurityGroupRule
 from paramiko.ssh_exception import NoValidConnectionsError
 
 from github_runner_manager.errors import KeyfileError, OpenStackError, SSHError
@@ -31,6 +29,14 @@ from github_runner_manager.openstack_cloud.configuration import OpenStackCredent
 from github_runner_manager.openstack_cloud.constants import CREATE_SERVER_TIMEOUT
 from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
 
+# The openstack SDK is slow to import, it is only imported when the OpenStack API is accessed.
+if TYPE_CHECKING:
+    from openstack.compute.v2.keypair import Keypair as OpenstackKeypair
+    from openstack.compute.v2.server import Server as OpenstackServer
+    from openstack.connection import Connection as OpenstackConnection
+    from openstack.network.v2.security_group import SecurityGroup as OpenstackSecurityGroup
+    from openstack.network.v2.security_group_rule import SecurityGroupRule
+
 logger = logging.getLogger(__name__)
 
 # Update the version when the security group rules are not backward compatible.
@@ -138,6 +144,10 @@ def _catch_openstack_errors(func: Callable[P, T]) -> Callable[P, T]:
         Returns:
             The return value of the decorated function.
         """
+        # pylint: disable=import-outside-toplevel
+        import keystoneauth1.exceptions
+        import openstack.exceptions
+
         try:
             return func(*args, **kwargs)
         except (
@@ -150,21 +160,52 @@ def _catch_openstack_errors(func: Callable[P, T]) -> Callable[P, T]:
     return exception_handling_wrapper
 
 
-@contextmanager
-def _get_openstack_connection(credentials: OpenStackCredentials) -> Iterator[OpenstackConnection]:
-    """Create a connection context managed object, to be used within with statements.
+class _ThreadConnection(threading.local):  # pylint: disable=too-few-public-methods
+    """The OpenStack connection kept open for the current thread.
+
+    Connections are not shared between threads, nor with forked processes.
+
+    Attributes:
+        connection: The connection, None if there is no connection open.
+        credentials: The credentials the connection was created with.
+        process_id: The ID of the process that created the connection.
+        close: Closes the connection, at most once. Also called when the thread ends.
+    """
 
-    Using the context manager ensures that the connection is properly closed after use.
+    connection: OpenstackConnection | None = None
+    credentials: OpenStackCredentials | None = None
+    process_id: int | None = None
+    close: weakref.finalize | None = None
+
+
+_thread_connection = _ThreadConnection()
+
+
+def _connect(credentials: OpenStackCredentials) -> OpenstackConnection:
+    """Get the connection of the current thread, creating it if needed.
+
+    The connection is reused to keep its keystone session.
 
     Args:
         credentials: The OpenStack authorization information.
 
-    Yields:
+    Returns:
         An openstack.connection.Connection object.
     """
+    import openstack  # pylint: disable=import-outside-toplevel
+
+    cached = _thread_connection
+    if (
+        cached.connection is not None
+        and cached.process_id == os.getpid()
+        and cached.credentials == credentials
+    ):
+        return cached.connection
+    _reset_connection()
+
     # api documents that keystoneauth1.exceptions.MissingRequiredOptions can be raised but
     # I could not reproduce it. Therefore, no catch here for such exception.
-    with openstack.connect(
+    conn = openstack.connect(
         auth_url=credentials.auth_url,
         project_name=credentials.project_name,
         username=credentials.username,
@@ -172,9 +213,58 @@ def _get_openstack_connection(credentials: OpenStackCredentials) -> Iterator[Ope
         region_name=credentials.region_name,
         user_domain_name=credentials.user_domain_name,
         project_domain_name=credentials.project_domain_name,
-    ) as conn:
+    )
+    close = weakref.finalize(threading.current_thread(), conn.close)
+    # Connections register their own close on exit.
+    close.atexit = False
+    cached.connection = conn
+    cached.credentials = credentials
+    cached.process_id = os.getpid()
+    cached.close = close
+    return conn
+
+
+def _reset_connection() -> None:
+    """Drop the connection of the current thread, closing it if this process created it."""
+    cached = _thread_connection
+    if cached.close is not None:
+        if cached.process_id == os.getpid():
+            cached.close()
+        else:
+            # Inherited from the parent process on fork, the parent still uses it.
+            cached.close.detach()
+    cached.connection = None
+    cached.credentials = None
+    cached.process_id = None
+    cached.close = None
+
+
+@contextmanager
+def _get_openstack_connection(credentials: OpenStackCredentials) -> Iterator[OpenstackConnection]:
+    """Get a connection context managed object, to be used within with statements.
+
+    The connection is kept open and reused by the calls of the same thread. It is closed on
+    authorization failure, so that the next call authenticates again.
+
+    Args:
+        credentials: The OpenStack authorization information.
+
+    Raises:
+        Unauthorized: If the authorization with OpenStack failed.
+
+    Yields:
+        An openstack.connection.Connection object.
+    """
+    import keystoneauth1.exceptions  # pylint: disable=import-outside-toplevel
+
+    conn = _connect(credentials)
+    try:
         conn.authorize()
         yield conn
+    except keystoneauth1.exceptions.http.Unauthorized:
+        logger.warning("OpenStack authorization failed, closing the connection")
+        _reset_connection()
+        raise
 
 
 class OpenstackCloud:
@@ -234,6 +324,8 @@ class OpenstackCloud:
         Returns:
             The OpenStack instance created.
         """
+        import openstack.exceptions  # pylint: disable=import-outside-toplevel
+
         logger.info("Creating openstack server with %s", instance_id)
 
         with _get_openstack_connection(credentials=self._credentials) as conn:
@@ -265,6 +357,21 @@ class OpenstackCloud:
                 raise OpenStackError(f"Timeout creating openstack server {instance_id}") from err
             except openstack.exceptions.SDKException as err:
                 logger.exception("Failed to create openstack server %s", instance_id)
+                # The server is attached when it was created but went into ERROR while booting.
+                if isinstance(err.extra_data, dict) and (
+                    errored_server := err.extra_data.get("server")
+                ):
+                    try:
+                        conn.delete_server(name_or_id=errored_server.id)
+                    except (
+                        openstack.exceptions.SDKException,
+                        openstack.exceptions.ResourceTimeout,
+                    ):
+                        logger.warning(
+                            "Unable to delete errored openstack server %s",
+                            instance_id,
+                            stack_info=True,
+                        )
                 self._delete_keypair(conn, instance_id)
                 raise OpenStackError(f"Failed to create openstack server {instance_id}") from err
 
@@ -310,6 +417,8 @@ class OpenstackCloud:
             conn: The openstack connection to use.
             instance_id: The full name of the server.
         """
+        import openstack.exceptions  # pylint: disable=import-outside-toplevel
+
         try:
             server = OpenstackCloud._get_and_ensure_unique_server(conn, instance_id)
             if server is not None:
@@ -396,12 +505,15 @@ class OpenstackCloud:
         logger.info("Getting all openstack servers managed by the charm")
 
         with _get_openstack_connection(credentials=self._credentials) as conn:
-            instance_list = list(self._get_openstack_instances(conn))
-            server_names = set(server.name for server in instance_list)
+            # Group the servers by name in a single pass, instead of filtering the whole list for
+            # each name.
+            servers_by_name: defaultdict[str, list[OpenstackServer]] = defaultdict(list)
+            for server in self._get_openstack_instances(conn):
+                servers_by_name[server.name].append(server)
 
             server_list = [
-                OpenstackCloud._get_and_ensure_unique_server(conn, name, instance_list)
-                for name in server_names
+                OpenstackCloud._get_and_ensure_unique_server(conn, name, servers)
+                for name, servers in servers_by_name.items()
             ]
             return tuple(
                 OpenstackInstance(server, self.prefix)
@@ -472,6 +584,8 @@ class OpenstackCloud:
             conn: The Openstack connection instance.
             exclude_keys: These keys will not be deleted.
         """
+        import openstack.exceptions  # pylint: disable=import-outside-toplevel
+
         logger.info("Cleaning up openstack keypairs")
         keypairs = conn.list_keypairs()
         for key in keypairs:
@@ -498,7 +612,7 @@ class OpenstackCloud:
         """
         return tuple(
             server
-            for server in cast(list[OpenstackServer], conn.list_servers())
+            for server in cast("list[OpenstackServer]", conn.list_servers())
             if InstanceID.name_has_prefix(self.prefix, server.name)
         )
 
@@ -519,6 +633,8 @@ class OpenstackCloud:
         Returns:
             A server with the name.
         """
+        import openstack.exceptions  # pylint: disable=import-outside-toplevel
+
         servers: list[OpenstackServer]
         if not all_servers:
             servers = conn.search_servers(name)
@@ -528,14 +644,9 @@ class OpenstackCloud:
         if not servers:
             return None
 
-        latest_server = reduce(
-            lambda a, b: (
-                a
-                if datetime.fromisoformat(a.created_at.replace("Z", "+00:00"))
-                < datetime.fromisoformat(b.created_at.replace("Z", "+00:00"))
-                else b
-            ),
+        latest_server = max(
             servers,
+            key=lambda server: datetime.fromisoformat(server.created_at.replace("Z", "+00:00")),
         )
         outdated_servers = filter(lambda x: x != latest_server, servers)
         for server in outdated_servers:
@@ -594,6 +705,8 @@ class OpenstackCloud:
             conn: The connection object to access OpenStack cloud.
             instance_id: The name of the keypair.
         """
+        import openstack.exceptions  # pylint: disable=import-outside-toplevel
+
         logger.debug("Deleting keypair for %s", instance_id)
         try:
             # Keypair have unique names, access by ID is not needed.
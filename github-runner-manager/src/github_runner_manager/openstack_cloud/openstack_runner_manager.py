@@ -3,14 +3,14 @@
 
 """Manager for self-hosted runner on OpenStack."""
 
+import functools
 import logging
-import secrets
+import random
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 import fabric
-import jinja2
 import paramiko
 from fabric import Connection as SSHConnection
 
@@ -43,6 +43,9 @@ from github_runner_manager.openstack_cloud.openstack_cloud import OpenstackCloud
 from github_runner_manager.repo_policy_compliance_client import RepoPolicyComplianceClient
 from github_runner_manager.utilities import retry, set_env_var
 
+if TYPE_CHECKING:
+    import jinja2
+
 logger = logging.getLogger(__name__)
 
 _CONFIG_SCRIPT_PATH = Path("/home/ubuntu/actions-runner/config.sh")
@@ -57,6 +60,24 @@ OUTDATED_METRICS_STORAGE_IN_SECONDS = CREATE_SERVER_TIMEOUT + 30  # add a bit on
 HEALTH_CHECK_ERROR_LOG_MSG = "Health check could not be completed for %s"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_jinja_environment() -> "jinja2.Environment":
+    """Get the jinja environment for the runner templates.
+
+    Jinja is imported on first use, as the templates are only needed to create runners. The
+    environment caches the compiled templates, which are not reloaded as they do not change.
+
+    Returns:
+        The jinja environment.
+    """
+    import jinja2  # pylint: disable=import-outside-toplevel
+
+    # We do not autoscape, the reason is that we are not generating html or xml
+    return jinja2.Environment(  # nosec
+        loader=jinja2.PackageLoader("github_runner_manager", "templates"), auto_reload=False
+    )
+
+
 class _GithubRunnerRemoveError(Exception):
     """Represents an error while SSH into a runner and running the remove script."""
 
@@ -104,12 +125,13 @@ class OpenStackRunnerManager(CloudRunnerManager):
         )
         # Setting the env var to this process and any child process spawned.
         proxies = config.service_config.proxy_config
-        if proxies and (no_proxy := proxies.no_proxy):
-            set_env_var("NO_PROXY", no_proxy)
-        if proxies and (http_proxy := proxies.http):
-            set_env_var("HTTP_PROXY", http_proxy)
-        if proxies and (https_proxy := proxies.https):
-            set_env_var("HTTPS_PROXY", https_proxy)
+        if proxies:
+            if no_proxy := proxies.no_proxy:
+                set_env_var("NO_PROXY", no_proxy)
+            if http_proxy := proxies.http:
+                set_env_var("HTTP_PROXY", http_proxy)
+            if https_proxy := proxies.https:
+                set_env_var("HTTPS_PROXY", https_proxy)
 
     @property
     def name_prefix(self) -> str:
@@ -373,19 +395,17 @@ class OpenStackRunnerManager(CloudRunnerManager):
         Returns:
             The cloud init userdata for openstack instance.
         """
-        # We do not autoscape, the reason is that we are not generating html or xml
-        jinja = jinja2.Environment(  # nosec
-            loader=jinja2.PackageLoader("github_runner_manager", "templates")
-        )
-
+        jinja = _get_jinja_environment()
         service_config = self._config.service_config
+        # The proxy address is derived from the proxy URL on each access, compute it once.
         runner_http_proxy = (
             service_config.runner_proxy_config.proxy_address
             if service_config.runner_proxy_config
             else None
         )
+        # Any of the configured debug servers is allowed, the pick does not need a secure RNG.
         ssh_debug_info = (
-            secrets.choice(service_config.ssh_debug_connections)
+            random.choice(service_config.ssh_debug_connections)  # nosec B311
             if service_config.ssh_debug_connections
             else None
         )
@@ -412,9 +432,7 @@ class OpenStackRunnerManager(CloudRunnerManager):
 
         pre_job_contents = jinja.get_template("pre-job.j2").render(pre_job_contents_dict)
 
-        aproxy_address = (
-            service_config.runner_proxy_config.proxy_address if service_config.use_aproxy else None
-        )
+        aproxy_address = runner_http_proxy if service_config.use_aproxy else None
         return jinja.get_template("openstack-userdata.sh.j2").render(
             run_script=runner_context.shell_run_script,
             env_contents=env_contents,
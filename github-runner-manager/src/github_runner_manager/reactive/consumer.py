@@ -111,6 +111,8 @@ def consume(
     Raises:
         QueueError: If an error when communicating with the queue occurs.
     """
+    # Label matching is case-insensitive, normalise the supported labels once for all messages.
+    supported_labels = {label.lower() for label in supported_labels}
     try:
         with (
             Connection(queue_config.mongodb_uri) as conn,
@@ -202,12 +204,12 @@ def _validate_labels(labels: Labels, supported_labels: Labels) -> bool:
 
     Args:
         labels: The labels of the job.
-        supported_labels: The supported labels for the runner.
+        supported_labels: The supported labels for the runner, already in lowercase.
 
     Returns:
         True if the labels are valid, False otherwise.
     """
-    return {label.lower() for label in labels} <= {label.lower() for label in supported_labels}
+    return {label.lower() for label in labels} <= supported_labels
 
 
 def _spawn_runner(
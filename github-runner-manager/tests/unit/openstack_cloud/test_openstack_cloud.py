@@ -2,9 +2,11 @@
 #  See LICENSE file for licensing details.
 import copy
 import datetime
+import gc
 import itertools
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
@@ -18,6 +20,8 @@ from openstack.network.v2.security_group import SecurityGroup as OpenstackSecuri
 from openstack.network.v2.security_group_rule import SecurityGroupRule
 
 from github_runner_manager.errors import OpenStackError
+from github_runner_manager.manager.models import InstanceID
+from github_runner_manager.openstack_cloud import openstack_cloud
 from github_runner_manager.openstack_cloud.openstack_cloud import (
     _MIN_KEYPAIR_AGE_IN_SECONDS_BEFORE_DELETION,
     DEFAULT_SECURITY_RULES,
@@ -25,6 +29,7 @@ from github_runner_manager.openstack_cloud.openstack_cloud import (
     OpenStackCredentials,
     get_missing_security_rules,
 )
+from tests.unit.factories import openstack_factory
 
 FAKE_ARG = "fake"
 FAKE_PREFIX = "fake_prefix"
@@ -32,6 +37,48 @@ FAKE_PREFIX = "fake_prefix"
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(name="reset_connection", autouse=True)
+def reset_connection_fixture():
+    """Drop the OpenStack connection kept by other tests."""
+    openstack_cloud._reset_connection()
+
+
+@pytest.fixture(name="cloud")
+def cloud_fixture(monkeypatch: pytest.MonkeyPatch) -> OpenstackCloud:
+    """Get an OpenstackCloud with fake credentials."""
+    # Mock expanduser as this is used in OpenstackCloud constructor
+    monkeypatch.setattr(
+        "github_runner_manager.openstack_cloud.openstack_cloud.Path.expanduser", MagicMock()
+    )
+    creds = OpenStackCredentials(
+        username=FAKE_ARG,
+        password=FAKE_ARG,
+        project_name=FAKE_ARG,
+        user_domain_name=FAKE_ARG,
+        project_domain_name=FAKE_ARG,
+        auth_url=FAKE_ARG,
+        region_name=FAKE_ARG,
+    )
+    return OpenstackCloud(creds, FAKE_PREFIX, FAKE_ARG)
+
+
+@pytest.fixture(name="openstack_connect_mock")
+def openstack_connect_mock_fixture(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock openstack.connect to return a mocked connection without servers."""
+    openstack_connection_mock = MagicMock(spec=Connection)
+    openstack_connection_mock.list_servers.return_value = []
+    openstack_connect_mock = MagicMock(spec=openstack.connect)
+    openstack_connect_mock.return_value = openstack_connection_mock
+    monkeypatch.setattr("openstack.connect", openstack_connect_mock)
+    return openstack_connect_mock
+
+
+@pytest.fixture(name="openstack_connection_mock")
+def openstack_connection_mock_fixture(openstack_connect_mock: MagicMock) -> MagicMock:
+    """Get the connection returned by the mocked openstack.connect."""
+    return openstack_connect_mock.return_value
+
+
 @pytest.mark.parametrize(
     "public_method, args",
     [
@@ -52,37 +99,19 @@ logger = logging.getLogger(__name__)
     ],
 )
 def test_raises_openstack_error(
-    public_method: str, args: dict[Any, Any], monkeypatch: pytest.MonkeyPatch
+    public_method: str,
+    args: dict[Any, Any],
+    cloud: OpenstackCloud,
+    openstack_connect_mock: MagicMock,
 ):
     """
     arrange: Mock OpenstackCloud and openstack.connect to raise an Openstack api exception.
     act: Call a public method which connects to Openstack.
     assert: OpenStackError is raised.
     """
-    creds = OpenStackCredentials(
-        username=FAKE_ARG,
-        password=FAKE_ARG,
-        project_name=FAKE_ARG,
-        user_domain_name=FAKE_ARG,
-        project_domain_name=FAKE_ARG,
-        auth_url=FAKE_ARG,
-        region_name=FAKE_ARG,
-    )
-    # Mock expanduser as this is used in OpenstackCloud constructor
-    monkeypatch.setattr(
-        "github_runner_manager.openstack_cloud.openstack_cloud.Path.expanduser", MagicMock()
-    )
-
-    cloud = OpenstackCloud(creds, FAKE_ARG, FAKE_ARG)
-    openstack_connect_mock = MagicMock(spec=openstack.connect)
-
     excs = (openstack.exceptions.SDKException, keystoneauth1.exceptions.ClientException)
     for exc in excs:
         openstack_connect_mock.side_effect = exc("an exception occurred")
-        monkeypatch.setattr(
-            "github_runner_manager.openstack_cloud.openstack_cloud.openstack.connect",
-            openstack_connect_mock,
-        )
         with pytest.raises(OpenStackError) as innerexc:
             getattr(cloud, public_method)(**args)
         assert "Failed OpenStack API call" in str(innerexc.value)
@@ -143,37 +172,21 @@ def test_missing_security_rules(security_rules, extra_ports, expected_missing_ru
     assert missing == expected_missing_rules
 
 
-def test_keypair_cleanup_freshly_created_keypairs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+def test_keypair_cleanup_freshly_created_keypairs(
+    cloud: OpenstackCloud,
+    openstack_connection_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
     """
     arrange: Keypairs with different creation time.
     act: Call cleanup.
     assert: Only keypairs older than a threshold are deleted.
     """
     # arrange #
-    # Mock expanduser as this is used in OpenstackCloud constructor
-    monkeypatch.setattr(
-        "github_runner_manager.openstack_cloud.openstack_cloud.Path.expanduser", MagicMock()
-    )
-
-    creds = OpenStackCredentials(
-        username=FAKE_ARG,
-        password=FAKE_ARG,
-        project_name=FAKE_ARG,
-        user_domain_name=FAKE_ARG,
-        project_domain_name=FAKE_ARG,
-        auth_url=FAKE_ARG,
-        region_name=FAKE_ARG,
-    )
-    cloud = OpenstackCloud(creds, FAKE_PREFIX, FAKE_ARG)
     cloud._ssh_key_dir = tmp_path / "ssh_key_dir"
     cloud._ssh_key_dir.mkdir()
 
-    openstack_connect_mock = MagicMock(spec=openstack.connect)
-    monkeypatch.setattr(
-        "github_runner_manager.openstack_cloud.openstack_cloud.openstack.connect",
-        openstack_connect_mock,
-    )
-
     now = _mock_datetime_now(monkeypatch)
     keypairs_older_or_same_min_age = (
         (
@@ -208,11 +221,7 @@ def test_keypair_cleanup_freshly_created_keypairs(monkeypatch: pytest.MonkeyPatc
             )
         )
 
-    openstack_connection_mock = MagicMock(spec=Connection)
-    openstack_connection_mock.__enter__.return_value = openstack_connection_mock
-    openstack_connection_mock.list_keypairs.return_value = keypair_list
     openstack_connection_mock.list_keypairs.return_value = keypair_list
-    openstack_connect_mock.return_value = openstack_connection_mock
 
     # act #
     cloud.cleanup()
@@ -230,6 +239,138 @@ def test_keypair_cleanup_freshly_created_keypairs(monkeypatch: pytest.MonkeyPatc
         assert keypair.name.removesuffix(".key") not in keypair_delete_calls
 
 
+def test_connection_reused(
+    cloud: OpenstackCloud, openstack_connect_mock: MagicMock, openstack_connection_mock: MagicMock
+):
+    """
+    arrange: Mock openstack.connect.
+    act: Call a public method twice, then fail the authorization and call it again.
+    assert: The connection is created once and created again after the authorization failure.
+    """
+    cloud.get_instances()
+    cloud.get_instances()
+    assert openstack_connect_mock.call_count == 1
+
+    openstack_connection_mock.authorize.side_effect = keystoneauth1.exceptions.http.Unauthorized
+    with pytest.raises(OpenStackError):
+        cloud.get_instances()
+    openstack_connection_mock.close.assert_called_once()
+    openstack_connection_mock.authorize.side_effect = None
+    cloud.get_instances()
+    assert openstack_connect_mock.call_count == 2
+
+
+def test_connection_per_thread(cloud: OpenstackCloud, openstack_connect_mock: MagicMock):
+    """
+    arrange: Mock openstack.connect.
+    act: Call a public method in the current thread and in another thread.
+    assert: Each thread creates its own connection, closed once the thread ends.
+    """
+    main_connection_mock = MagicMock(spec=Connection)
+    main_connection_mock.list_servers.return_value = []
+    thread_connection_mock = MagicMock(spec=Connection)
+    thread_connection_mock.list_servers.return_value = []
+    openstack_connect_mock.side_effect = [main_connection_mock, thread_connection_mock]
+
+    cloud.get_instances()
+    thread = threading.Thread(target=cloud.get_instances)
+    thread.start()
+    thread.join()
+    del thread
+    gc.collect()
+
+    assert openstack_connect_mock.call_count == 2
+    thread_connection_mock.close.assert_called_once()
+    main_connection_mock.close.assert_not_called()
+
+
+def test_get_instances_deletes_duplicates(
+    cloud: OpenstackCloud, openstack_connection_mock: MagicMock
+):
+    """
+    arrange: Mock openstack.connect to list servers where one name is duplicated.
+    act: Get the instances.
+    assert: One instance per name is returned, the latest duplicate is kept and the older one is
+        deleted.
+    """
+    duplicate_name = InstanceID.build(FAKE_PREFIX).name
+    unique_name = InstanceID.build(FAKE_PREFIX).name
+    first_server = openstack_factory.ServerFactory(
+        id="first", name=duplicate_name, created_at="2024-09-12T02:48:03Z"
+    )
+    second_server = openstack_factory.ServerFactory(
+        id="second", name=duplicate_name, created_at="2024-09-12T03:48:03Z"
+    )
+    unique_server = openstack_factory.ServerFactory(id="unique", name=unique_name)
+    openstack_connection_mock.list_servers.return_value = [
+        first_server,
+        unique_server,
+        second_server,
+        openstack_factory.ServerFactory(id="other", name="other-prefix-server"),
+    ]
+
+    instances = cloud.get_instances()
+
+    assert {instance.server_id for instance in instances} == {"second", "unique"}
+    openstack_connection_mock.delete_server.assert_called_once_with(name_or_id="first")
+
+
+@pytest.mark.parametrize(
+    "extra_data",
+    [
+        pytest.param(None, id="server not created"),
+        pytest.param({"errored"}, id="extra data not a dict"),
+        pytest.param(
+            {"server": openstack_factory.ServerFactory(id="errored")}, id="server in error"
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "delete_server_error",
+    [
+        pytest.param(None, id="server deleted"),
+        pytest.param(openstack.exceptions.SDKException("delete failed"), id="delete fails"),
+    ],
+)
+def test_launch_instance_cleanup_on_failure(
+    extra_data: Any,
+    delete_server_error: Exception | None,
+    cloud: OpenstackCloud,
+    openstack_connection_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: Mock create_server to fail with or without a server, and delete_server to fail or not.
+    act: Launch an instance.
+    assert: The creation error is raised, the errored server is deleted by ID if it was created
+        and the keypair is deleted.
+    """
+    monkeypatch.setattr(OpenstackCloud, "_ensure_security_group", MagicMock())
+    monkeypatch.setattr(OpenstackCloud, "_setup_keypair", MagicMock())
+    monkeypatch.setattr(OpenstackCloud, "_delete_keypair", MagicMock())
+    instance_id = InstanceID.build(FAKE_PREFIX)
+    openstack_connection_mock.create_server.side_effect = openstack.exceptions.SDKException(
+        "Error in creating the server",
+        extra_data=extra_data,
+    )
+    openstack_connection_mock.delete_server.side_effect = delete_server_error
+
+    with pytest.raises(OpenStackError, match="Failed to create openstack server"):
+        cloud.launch_instance(
+            metadata=MagicMock(),
+            instance_id=instance_id,
+            server_config=MagicMock(),
+            cloud_init=FAKE_ARG,
+        )
+
+    if isinstance(extra_data, dict):
+        openstack_connection_mock.delete_server.assert_called_once_with(name_or_id="errored")
+    else:
+        openstack_connection_mock.delete_server.assert_not_called()
+    openstack_connection_mock.search_servers.assert_not_called()
+    OpenstackCloud._delete_keypair.assert_called_once()
+
+
 def _mock_datetime_now(monkeypatch):
     """Mock datetime.now() to return a fixed datetime."""
     now = datetime.datetime.now(datetime.timezone.utc)
@@ -30,8 +30,8 @@ def queue_config_fixture() -> QueueConfig:
     """Return a QueueConfig object."""
     queue_name = secrets.token_hex(16)
 
-    # we use construct to avoid pydantic validation as IN_MEMORY_URI is not a valid URL
-    return QueueConfig.construct(mongodb_uri=IN_MEMORY_URI, queue_name=queue_name)
+    # direct construction does not validate the URI, IN_MEMORY_URI is not a MongoDB URI
+    return QueueConfig(mongodb_uri=IN_MEMORY_URI, queue_name=queue_name)
 
 
 @pytest.fixture(name="mock_sleep", autouse=True)
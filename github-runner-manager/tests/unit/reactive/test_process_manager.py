@@ -70,8 +70,8 @@ def reactive_process_config_fixture() -> ReactiveProcessConfig:
     """Return a ReactiveProcessConfig object."""
     queue_name = secrets.token_hex(16)
 
-    # we use construct to avoid pydantic validation as IN_MEMORY_URI is not a valid URL
-    queue_config = QueueConfig.construct(mongodb_uri=EXAMPLE_MQ_URI, queue_name=queue_name)
+    # direct construction does not validate the URI, EXAMPLE_MQ_URI is not a MongoDB URI
+    queue_config = QueueConfig(mongodb_uri=EXAMPLE_MQ_URI, queue_name=queue_name)
     return ReactiveProcessConfig.construct(queue=queue_config)
 
 
@@ -10,7 +10,7 @@ from ipaddress import IPv4Address
 
 import pytest
 import yaml
-from pydantic import MongoDsn
+from pydantic import MongoDsn, ValidationError
 
 from src.github_runner_manager.configuration import (
     ApplicationConfiguration,
@@ -207,3 +207,118 @@ def test_load_configuration_from_yaml(app_config: ApplicationConfiguration):
     yaml_config = yaml.safe_load(StringIO(SAMPLE_YAML_CONFIGURATION))
     loaded_app_config = ApplicationConfiguration.validate(yaml_config)
     assert loaded_app_config == app_config
+
+
+@pytest.mark.parametrize(
+    "path, value",
+    [
+        pytest.param(
+            ("reactive_configuration", "queue"), {"queue_name": "app_name"}, id="queue missing uri"
+        ),
+        pytest.param(
+            ("reactive_configuration", "queue"),
+            {"mongodb_uri": "http://localhost:27017", "queue_name": "app_name"},
+            id="queue wrong scheme",
+        ),
+        pytest.param(
+            ("reactive_configuration", "queue"),
+            {"mongodb_uri": "mongodb://", "queue_name": "app_name"},
+            id="queue missing host",
+        ),
+        pytest.param(
+            ("reactive_configuration", "images", 0), {"labels": ["noble"]}, id="image missing name"
+        ),
+        pytest.param(
+            ("reactive_configuration", "images", 0),
+            {"name": None, "labels": ["noble"]},
+            id="image null name",
+        ),
+        pytest.param(
+            ("reactive_configuration", "images", 0),
+            {"name": "image_id"},
+            id="image missing labels",
+        ),
+        pytest.param(
+            ("reactive_configuration", "images", 0),
+            {"name": "image_id", "labels": "noble"},
+            id="image labels not a list",
+        ),
+        pytest.param(
+            ("reactive_configuration", "images", 0),
+            {"name": "image_id", "labels": ["noble", 1]},
+            id="image label not a string",
+        ),
+        pytest.param(
+            ("non_reactive_configuration", "combinations", 0, "flavor"),
+            {"labels": ["large"]},
+            id="flavor missing name",
+        ),
+        pytest.param(
+            ("non_reactive_configuration", "combinations", 0, "flavor"),
+            {"name": 1, "labels": ["large"]},
+            id="flavor name not a string",
+        ),
+        pytest.param(
+            ("non_reactive_configuration", "combinations", 0, "flavor"),
+            {"name": "flavor", "labels": None},
+            id="flavor null labels",
+        ),
+        pytest.param(
+            ("service_config", "repo_policy_compliance"),
+            {"url": "https://compliance.example.com"},
+            id="repo policy compliance missing token",
+        ),
+        pytest.param(
+            ("service_config", "repo_policy_compliance"),
+            {"token": None, "url": "https://compliance.example.com"},
+            id="repo policy compliance null token",
+        ),
+        pytest.param(
+            ("service_config", "repo_policy_compliance"),
+            {"token": "token"},
+            id="repo policy compliance missing url",
+        ),
+        pytest.param(
+            ("service_config", "repo_policy_compliance"),
+            {"token": "token", "url": "ftp://compliance.example.com"},
+            id="repo policy compliance wrong scheme",
+        ),
+    ],
+)
+def test_load_configuration_invalid_value(path: tuple[str | int, ...], value: dict):
+    """
+    arrange: A sample configuration in YAML format with an invalid value at the given path.
+    act: Get the ApplicationConfiguration object.
+    assert: A validation error is raised.
+    """
+    yaml_config = yaml.safe_load(StringIO(SAMPLE_YAML_CONFIGURATION))
+    parent = yaml_config
+    for key in path[:-1]:
+        parent = parent[key]
+    parent[path[-1]] = value
+    with pytest.raises(ValidationError):
+        ApplicationConfiguration.validate(yaml_config)
+
+
+@pytest.mark.parametrize(
+    "fingerprint_field",
+    [
+        pytest.param("rsa_fingerprint", id="rsa"),
+        pytest.param("ed25519_fingerprint", id="ed25519"),
+    ],
+)
+def test_ssh_debug_connection_invalid_fingerprint(fingerprint_field: str):
+    """
+    arrange: SSH debug connection values with a fingerprint not prefixed by SHA256:.
+    act: Create the SSHDebugConnection.
+    assert: A validation error is raised.
+    """
+    values = {
+        "host": "10.10.10.10",
+        "port": 3000,
+        "rsa_fingerprint": "SHA256:rsa",
+        "ed25519_fingerprint": "SHA256:ed25519",
+    }
+    values[fingerprint_field] = "MD5:invalid"
+    with pytest.raises(ValidationError):
+        SSHDebugConnection(**values)
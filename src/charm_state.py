@@ -132,6 +132,13 @@ class Arch(str, Enum):
     X64 = "x64"
 
 
+# Machine architecture names as reported by platform.machine().
+_SUPPORTED_ARCHES: dict[str, Arch] = {
+    **{arch: Arch.ARM64 for arch in ARCHITECTURES_ARM64},
+    **{arch: Arch.X64 for arch in ARCHITECTURES_X86},
+}
+
+
 class CharmConfigInvalidError(Exception):
     """Raised when charm config is invalid.
 
@@ -636,13 +643,10 @@ def _get_supported_arch() -> Arch:
         Arch: Current machine architecture.
     """
     arch = platform.machine()
-    match arch:
-        case arch if arch in ARCHITECTURES_ARM64:
-            return Arch.ARM64
-        case arch if arch in ARCHITECTURES_X86:
-            return Arch.X64
-        case _:
-            raise UnsupportedArchitectureError(arch=arch)
+    try:
+        return _SUPPORTED_ARCHES[arch]
+    except KeyError:
+        raise UnsupportedArchitectureError(arch=arch) from None
 
 
 def _build_ssh_debug_connection_from_charm(charm: CharmBase) -> list[SSHDebugConnection]:
@@ -14,6 +14,7 @@ from github_runner_manager.configuration import (
     NonReactiveConfiguration,
     QueueConfig,
     ReactiveConfiguration,
+    RepoPolicyComplianceConfig,
     SupportServiceConfig,
     UserInfo,
 )
@@ -67,13 +68,19 @@ def create_application_configuration(
         token=state.charm_config.token,
         path=state.charm_config.path,
     )
+    repo_policy_compliance = None
+    if charm_repo_policy_compliance := state.charm_config.repo_policy_compliance:
+        repo_policy_compliance = RepoPolicyComplianceConfig(
+            token=charm_repo_policy_compliance.token,
+            url=str(charm_repo_policy_compliance.url),
+        )
     service_config = SupportServiceConfig(
         manager_proxy_command=state.charm_config.manager_proxy_command,
         proxy_config=state.proxy_config,
         runner_proxy_config=state.runner_proxy_config,
         dockerhub_mirror=state.charm_config.dockerhub_mirror,
         ssh_debug_connections=state.ssh_debug_connections,
-        repo_policy_compliance=state.charm_config.repo_policy_compliance,
+        repo_policy_compliance=repo_policy_compliance,
         use_aproxy=state.charm_config.use_aproxy,
     )
     non_reactive_configuration = _get_non_reactive_configuration(state)
@@ -153,7 +160,7 @@ def _get_reactive_configuration(state: CharmState, app_name: str) -> ReactiveCon
         images = [image]
         flavors = [flavor]
     return ReactiveConfiguration(
-        queue=QueueConfig(mongodb_uri=reactive_config.mq_uri, queue_name=app_name),
+        queue=QueueConfig(mongodb_uri=str(reactive_config.mq_uri), queue_name=app_name),
         max_total_virtual_machines=state.runner_config.max_total_virtual_machines,
         images=images,
         flavors=flavors,
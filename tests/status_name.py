@@ -1,8 +1,6 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from ops.model import ActiveStatus, BlockedStatus
-
-# mypy can not find type of `name` attribute.
-ACTIVE = ActiveStatus.name  # type: ignore
-BLOCKED = BlockedStatus.name  # type: ignore
+# Names of the ops.model statuses, hardcoded so that importing them does not import ops.
+ACTIVE = "active"
+BLOCKED = "blocked"
@@ -0,0 +1,19 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Test cases for the status names shared by the tests."""
+
+from ops.model import ActiveStatus, BlockedStatus
+
+from tests.status_name import ACTIVE, BLOCKED
+
+
+def test_status_names_match_ops():
+    """
+    arrange: None.
+    act: None.
+    assert: The hardcoded status names match the names of the ops statuses.
+    """
+    # mypy can not find type of `name` attribute.
+    assert ACTIVE == ActiveStatus.name  # type: ignore
+    assert BLOCKED == BlockedStatus.name  # type: ignore